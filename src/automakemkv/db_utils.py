@@ -9,6 +9,7 @@ MEDIATYPE = {
     '1920x1080': 'Blu-Ray',
     '720x480': 'DVD',
 }
+VIDRES_REG = re.compile(rb'(\d{1,}x\d{1,})')
 
 DISCMETAKEYS = [
     'title',
@@ -34,8 +35,9 @@ def add_disc_info_to_titles(db_root):
             continue
         file = os.path.join(db_root, file)
 
-        with open(file, 'r') as iid:
-            data = json.load(iid)
+        data = load_json(file)
+        if data is None:
+            continue
 
         for info in data['titles'].values():
             for key in DISCMETAKEYS:
@@ -70,8 +72,9 @@ def add_media_type(db_root):
             log.warning('Could NOT find %s, skipping', info_file)
             continue
 
-        with open(file, 'r') as iid:
-            json_data = json.load(iid)
+        json_data = load_json(file)
+        if json_data is None:
+            continue
 
         if 'media_type' in json_data:
             log.info('Media_type already exists: %s', file)
@@ -89,6 +92,29 @@ def add_media_type(db_root):
             json.dump(json_data, oid, indent=4)
 
 
+def load_json(file: str) -> dict | None:
+    """
+    Load database JSON file
+
+    Arguments:
+        file (str): Path of JSON file to load
+
+    Returns:
+        dict | None: Data from file, None if the file could not be read
+            or is not valid JSON
+
+    """
+
+    try:
+        with open(file, 'r') as iid:
+            return json.load(iid)
+    except (OSError, json.JSONDecodeError) as error:
+        logging.getLogger(__name__).warning(
+            'Could NOT load %s, skipping: %s', file, error,
+        )
+    return None
+
+
 def get_media_type(file: str):
 
     res = get_vid_res(file)
@@ -107,6 +133,6 @@ def get_vid_res(file: str):
     with gzip.open(file) as iid:
         data = iid.read()
     res = set(
-        re.findall(rb'(\d{1,}x\d{1,})', data)
+        VIDRES_REG.findall(data)
     )
     return [val.decode() for val in res]
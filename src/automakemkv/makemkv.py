@@ -7,6 +7,7 @@ import logging
 import os
 import re
 import gzip
+import fcntl
 
 from threading import Event
 from subprocess import (
@@ -36,6 +37,10 @@ SWITCHES = ('noscan', 'robot', 'decrypt')
 SOURCES = ('iso', 'file', 'disc', 'dev')
 COMMANDS = ('info', 'mkv', 'backup', 'f', 'reg')
 
+PIPE_SIZE = 2**20  # Size of pipes from makemkvcon; 1 MiB
+# Linux only; constant added to fcntl module in Python 3.10
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+
 
 class MakeMKVThread(QtCore.QThread):
     """
@@ -45,6 +50,9 @@ class MakeMKVThread(QtCore.QThread):
 
     """
 
+    # Emitted with the makemkvcon process once it has been started
+    NEW_PROCESS = QtCore.pyqtSignal(Popen)
+
     def __init__(
         self,
         command: str,
@@ -192,13 +200,19 @@ class MakeMKVThread(QtCore.QThread):
             ' '.join(cmd),
         )
 
+        # Match read buffer to pipe size so bursts of output are picked up
+        # in few reads. Pipes are left in binary mode; readers decode only
+        # the lines they actually use
         self.proc = Popen(
             cmd,
-            universal_newlines=True,
+            bufsize=PIPE_SIZE,
             stdout=PIPE,
             stderr=PIPE,
         )
+        for pipe in (self.proc.stdout, self.proc.stderr):
+            _set_pipe_size(pipe)
         self.started.set()
+        self.NEW_PROCESS.emit(self.proc)
 
     def run(self):
         """Method to run in thread"""
@@ -230,11 +244,14 @@ class MakeMKVRip(MakeMKVThread):
         if self.proc is None:
             return
 
-        for line in iter(self.proc.stdout.readline, ''):
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        for line in iter(self.proc.stdout.readline, b''):
+            if not debug:
+                continue
             self.log.debug(
                 "%s - %s",
                 self.source[1],
-                line.rstrip(),
+                decode(line).rstrip(),
             )
         self.proc.wait()
         self.proc.communicate()
@@ -303,10 +320,10 @@ class MakeMKVInfo(MakeMKVThread):
 
         # Open gzip file for storing robot output and write MakeMKV
         # output to file
-        with gzip.open(self.info_path, 'wt') as fid:
-            for line in iter(self.proc.stdout.readline, ''):
+        with gzip.open(self.info_path, 'wb') as fid:
+            for line in iter(self.proc.stdout.readline, b''):
                 fid.write(line)
-                self.parse_line(line)
+                self.parse_line(decode(line))
         self.proc.wait()
         self.proc.communicate()
 
@@ -354,6 +371,43 @@ class MakeMKVInfo(MakeMKVThread):
                 tt[stream][AP[sid]] = val.strip('"')
 
 
+def decode(line: bytes) -> str:
+    """
+    Decode a line of makemkvcon output
+
+    Arguments:
+        line (bytes): Raw line read from a makemkvcon pipe
+
+    Returns:
+        str: Decoded line; undecodable bytes are replaced
+
+    """
+
+    return line.decode('utf-8', 'replace')
+
+
+def _set_pipe_size(pipe, size: int = PIPE_SIZE) -> None:
+    """
+    Enlarge pipe buffer
+
+    makemkvcon blocks writing to a full pipe, which stalls the rip if the
+    reader is briefly busy. Enlarging the pipe gives the reader more slack.
+    Not all platforms support resizing pipes, so failures are ignored.
+
+    Arguments:
+        pipe: File object of pipe to resize
+
+    Keyword arguments:
+        size (int): Requested size of the pipe buffer in bytes
+
+    """
+
+    try:
+        fcntl.fcntl(pipe.fileno(), F_SETPIPE_SZ, size)
+    except OSError:
+        pass
+
+
 def _dev_to_disc(timeout: float | int = 60.0) -> dict:
     """
     Get dict of dev devices to MakeMKV disc ids
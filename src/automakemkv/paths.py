@@ -129,8 +129,7 @@ def build_outfile(
 
     """
 
-    if not os.path.isdir(outdir):
-        os.makedirs(outdir)
+    os.makedirs(outdir, exist_ok=True)
 
     if not ext.startswith('.'):
         ext = "."+ext
@@ -326,8 +325,7 @@ def video_utils_outfile(
 
     """
 
-    if not os.path.isdir(outdir):
-        os.makedirs(outdir)
+    os.makedirs(outdir, exist_ok=True)
 
     if not ext.startswith('.'):
         ext = "."+ext
@@ -5,7 +5,11 @@ Utilities for ripping titles
 
 import logging
 from collections.abc import Callable
+import errno
 import os
+import queue
+import shutil
+import stat
 import subprocess
 from PyQt5 import QtCore
 
@@ -14,6 +18,7 @@ from . import makemkv
 from .ui import metadata
 
 SIZE_POLL = 10
+EXTRACT_THREADS = 2  # Number of titles to extract from a backup at once
 
 
 class DiscHandler(QtCore.QObject):
@@ -32,6 +37,8 @@ class DiscHandler(QtCore.QObject):
         root: str,
         filegen: Callable,
         progress_dialog,
+        discid: str | None = None,
+        extract_threads: int = EXTRACT_THREADS,
         **kwargs,
     ):
         """
@@ -55,6 +62,10 @@ class DiscHandler(QtCore.QObject):
                 a dictionary of data loaded from the
                 disc database, and extras specifies if
                 extras should be ripped.
+            discid (str) : UUID of the disc, as found by the watchdog.
+                None if the disc has no UUID; it is not looked up again.
+            extract_threads (int) : Maximum number of titles to extract
+                from a disc backup at the same time.
 
         """
 
@@ -62,7 +73,7 @@ class DiscHandler(QtCore.QObject):
         self.log = logging.getLogger(__name__)
 
         self.dev = dev
-        self.discid = utils.get_discid(dev, root)
+        self.discid = discid
         self.outdir = outdir
         self.everything = everything
         self.extras = extras
@@ -70,6 +81,8 @@ class DiscHandler(QtCore.QObject):
         self.root = root
         self.filegen = filegen
         self.progress_dialog = progress_dialog
+        self.extract_threads = extract_threads
+        self.outdir_rotational = utils.is_rotational(outdir)
 
         self.options = None
         self.metadata = None
@@ -205,6 +218,17 @@ class DiscHandler(QtCore.QObject):
 
         # Initialize ripper object
         if result == metadata.RIP:
+            # Concurrent extractions thrash spinning disks, so only extract
+            # one title at a time if output is on one
+            extract_threads = self.extract_threads
+            if self.outdir_rotational:
+                self.log.debug(
+                    "%s - Output on rotational storage, extracting one "
+                    "title at a time",
+                    dev,
+                )
+                extract_threads = 1
+
             self.ripper = Ripper(
                 dev,
                 self.info,
@@ -214,6 +238,7 @@ class DiscHandler(QtCore.QObject):
                 self.extras,
                 self.filegen,
                 self.progress_dialog,
+                extract_threads=extract_threads,
             )
             self.ripper.start()
             return
@@ -233,6 +258,7 @@ class Ripper(QtCore.QThread):
         extras: bool,
         filegen: Callable,
         progress,
+        extract_threads: int = EXTRACT_THREADS,
     ):
 
         super().__init__()
@@ -247,6 +273,9 @@ class Ripper(QtCore.QThread):
         self.extras = extras
         self.filegen = filegen
         self.progress = progress
+        self.extract_threads = max(1, extract_threads)
+        self.mkv_thread = None
+        self.running = {}  # Extraction threads to their title and output
         self.tmpdir = os.path.join(
             outdir,
             os.path.basename(dev),
@@ -273,11 +302,10 @@ class Ripper(QtCore.QThread):
             )
         )
 
-        # Get list of all titles in the info dict
-        title_nums = list(self.info['titles'].keys())
-        for title in title_nums:
-            if title not in paths:
-                _ = self.info['titles'].pop(title)
+        # Drop titles that do not have an output path
+        titles = self.info['titles']
+        for title in titles.keys() - paths.keys():
+            del titles[title]
 
         self.log.debug(
             "%s - Creating temporary directory : '%s'",
@@ -287,7 +315,7 @@ class Ripper(QtCore.QThread):
         os.makedirs(self.tmpdir, exist_ok=True)
 
         if len(paths) == 1:
-            title, output = list(paths.items())[0]
+            title, output = next(iter(paths.items()))
             self.rip_title(title, output)
             return
 
@@ -329,51 +357,22 @@ class Ripper(QtCore.QThread):
 
         self.mkv_thread.wait()
 
-        files = [
-            os.path.join(self.tmpdir, item)
-            for item in os.listdir(self.tmpdir)
-        ]
-
+        # The tmpdir only holds output from this rip, so remove it whole
+        # on failure
         if self.mkv_thread.returncode != 0:
-            fdirs = []
-            for fname in files:
-                fdir = os.path.dirname(fname)
-                fdirs.append(fdir)
-                os.remove(fname)
-            for fdir in set(fdirs):
-                try:
-                    os.rmdir(fdir)
-                except FileNotFoundError:
-                    pass
-                else:
-                    self.log.debug("%s - Removed dir: %s", self.dev, fdir)
-
-            self.log.error(
-                "Error ripping track '%s' from '%s'",
-                title,
-                self.dev,
-            )
-            return False
+            return self._fail(self.tmpdir, "Error ripping track '%s'", title)
 
-        if len(files) != 1:
-            self.log.error("%s - Too many output files!", self.dev)
-            for fname in files:
-                os.remove(fname)
-            return False
+        fname = single_file(self.tmpdir)
+        if fname is None:
+            return self._fail(self.tmpdir, "Too many output files!")
 
         self.log.info(
             "%s - Renaming file '%s' ---> '%s'",
             self.dev,
-            files[0],
+            fname,
             output,
         )
-        # Ensure output directory exists
-        os.makedirs(
-            os.path.dirname(output),
-            exist_ok=True,
-        )
-        # Rename the file
-        os.rename(files[0], output)
+        move_file(fname, output)
 
         return True
 
@@ -419,72 +418,154 @@ class Ripper(QtCore.QThread):
 
         if self.mkv_thread.returncode != 0:
             self.log.warning("%s - Error backing up disc", self.dev)
-            try:
-                os.remove(tmppath)
-            except FileNotFoundError:
-                pass
-            os.rmdir(self.tmpdir)
-            self.log.debug("%s - Removed dir: %s", self.dev, self.tmpdir)
-            return
+            remove_path(tmppath)
+            return False
 
-        for title, output in paths.items():
-            mkv_thread = makemkv.MakeMKVRip(
-                'mkv',
-                iso=tmppath,
-                title=title,
-                output=self.tmpdir,
-            )
-            mkv_thread.start()
+        # Keep up to extract_threads extractions running at once and start
+        # the next title as soon as any of them finishes. No new titles are
+        # started once the rip is cancelled
+        done = queue.Queue()
+        pending = list(paths.items())
+        while (pending and not self._dead) or self.running:
+            while (
+                pending
+                and not self._dead
+                and len(self.running) < self.extract_threads
+            ):
+                title, output = pending.pop(0)
+                mkv_thread = self.start_extract(tmppath, title, done)
+                self.running[mkv_thread] = (title, output)
+            if len(self.running) == 0:
+                break
+            mkv_thread = done.get()
             mkv_thread.wait()
-            if mkv_thread.returncode != 0:
-                self.log.warning(
-                    "%s - Failed to extract title %s from backup %s",
-                    self.dev,
-                    title,
-                    tmppath,
-                )
-                continue
-
-            files = [
-                os.path.join(self.tmpdir, item)
-                for item in os.listdir(self.tmpdir)
-                if item != tmpfile
-            ]
-
-            if len(files) != 1:
-                self.log.error("%s - Too many output files!", self.dev)
-                for fname in files:
-                    os.remove(fname)
-                continue
-
-            self.log.info(
-                "%s - Renaming file '%s' ---> '%s'",
-                self.dev,
-                files[0],
-                output,
-            )
-            # Ensure output directory exists
-            os.makedirs(
-                os.path.dirname(output),
-                exist_ok=True,
+            title, output = self.running.pop(mkv_thread)
+            self.finish_extract(mkv_thread, tmppath, title, output)
+
+        remove_path(tmppath)
+
+        return True
+
+    def start_extract(self, tmppath: str, title: str, done: queue.Queue):
+        """
+        Start extracting a title from disc backup
+
+        Each title is extracted to its own directory under the tmpdir so
+        that concurrent extractions do not mix up output files.
+
+        Arguments:
+            tmppath (str) : Path to the decrypted disc backup
+            title (str) : Title to extract
+            done (queue.Queue) : Thread is put on this queue when it
+                finishes
+
+        Returns:
+            MakeMKVRip : Thread running the extraction
+
+        """
+
+        title_dir = os.path.join(self.tmpdir, f"title_{title}")
+        os.makedirs(title_dir, exist_ok=True)
+        # No progress parser reads these processes, so send progress
+        # messages to stdout, which the thread drains, rather than leaving
+        # them to fill up the stderr pipe and block makemkvcon
+        mkv_thread = makemkv.MakeMKVRip(
+            'mkv',
+            iso=tmppath,
+            title=title,
+            output=title_dir,
+            progress='-stdout',
+        )
+        # This thread blocks on the queue rather than running an event
+        # loop, so the slot must run directly in the finishing thread
+        mkv_thread.finished.connect(
+            lambda: done.put(mkv_thread),
+            QtCore.Qt.DirectConnection,
+        )
+        mkv_thread.start()
+        return mkv_thread
+
+    def finish_extract(
+        self,
+        mkv_thread,
+        tmppath: str,
+        title: str,
+        output: str,
+    ):
+        """
+        Move extracted title to final location
+
+        Arguments:
+            mkv_thread (MakeMKVRip) : Finished extraction thread
+            tmppath (str) : Path to the decrypted disc backup
+            title (str) : Title that was extracted
+            output (str) : Name of the output file
+
+        Returns:
+            bool : True if extracted, False otherwise
+
+        """
+
+        title_dir = mkv_thread.output
+        if mkv_thread.returncode != 0:
+            return self._fail(
+                title_dir,
+                "Failed to extract title %s from backup %s",
+                title,
+                tmppath,
             )
-            # Rename the file
-            os.rename(files[0], output)
 
-        try:
-            os.remove(tmppath)
-        except FileNotFoundError:
-            pass
+        fname = single_file(title_dir)
+        if fname is None:
+            return self._fail(title_dir, "Too many output files!")
+
+        self.log.info(
+            "%s - Renaming file '%s' ---> '%s'",
+            self.dev,
+            fname,
+            output,
+        )
+        move_file(fname, output)
+        os.rmdir(title_dir)
 
         return True
 
+    def _fail(self, path: str, msg: str, *args) -> bool:
+        """
+        Log failed rip and remove its output
+
+        Arguments:
+            path (str) : Directory holding output of the failed rip
+            msg (str) : Log message; the dev is prepended
+            *args : Arguments for formatting msg
+
+        Returns:
+            bool : Always False; the result of the failed rip
+
+        """
+
+        self.log.error("%s - " + msg, self.dev, *args)
+        remove_dir(path)
+        self.log.debug("%s - Removed dir: %s", self.dev, path)
+        return False
+
     def run(self):
         self.rip()
 
+        # Single place the tmpdir is cleaned up; it may already be gone if
+        # a failed rip removed it
         try:
             os.rmdir(self.tmpdir)
-        except Exception as err:
-            self.log.info("%s - Failed to remove directory", self.dev, err)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            self.log.warning(
+                "%s - Failed to remove directory: %s",
+                self.dev,
+                err,
+            )
+        else:
+            self.log.debug("%s - Removed dir: %s", self.dev, self.tmpdir)
 
         self.progress.MKV_REMOVE_DISC.emit(self.dev)
         subprocess.call(['eject', self.dev])
@@ -497,9 +578,10 @@ class Ripper(QtCore.QThread):
 
         self.log.info("%s - Terminating rip", dev)
         self._dead = True
-        if self.mkv_thread is None:
-            return
-        self.mkv_thread.terminate()
+        if self.mkv_thread is not None:
+            self.mkv_thread.terminate()
+        for mkv_thread in list(self.running):
+            mkv_thread.terminate()
 
 
 def directory_size(path):
@@ -513,3 +595,103 @@ def directory_size(path):
         for d in os.scandir(path)
         if d.is_file()
     )
+
+
+def single_file(path: str) -> str | None:
+    """
+    Get the only file in a directory
+
+    Stops scanning as soon as a second entry is found.
+
+    Arguments:
+        path (str): Directory to scan
+
+    Returns:
+        str | None: Full path of the file if it is the only entry in the
+            directory, None otherwise
+
+    """
+
+    found = None
+    with os.scandir(path) as it:
+        for entry in it:
+            if found is not None:
+                return None
+            found = entry.path
+    return found
+
+
+def move_file(src: str, dst: str) -> None:
+    """
+    Move file to new location
+
+    The rename is attempted first; the output directory is only created
+    if the rename fails because it does not exist, so no directory checks
+    are done when it already does. If dst is on a different file system,
+    the file is copied instead.
+
+    Arguments:
+        src (str): File to move
+        dst (str): Path to move file to
+
+    """
+
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        os.replace(src, dst)
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+        # Output is on a different file system than the tmpdir
+        shutil.move(src, dst)
+
+
+def remove_path(path):
+    """
+    Remove file or directory tree at path
+
+    makemkvcon disc backups are directories, so the path type is checked
+    with a single lstat and the matching removal used. Some platforms
+    (e.g., macOS) do not raise IsADirectoryError when unlinking a
+    directory, so the type is not inferred from the error.
+
+    Arguments:
+        path (str): File or directory to remove
+
+    """
+
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+
+    if stat.S_ISDIR(st.st_mode):
+        remove_dir(path)
+        return
+
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def remove_dir(path):
+    """
+    Remove directory and its contents
+
+    Output directories are often already empty, so a plain rmdir is tried
+    first and the full tree walk is only done if that fails.
+
+    Arguments:
+        path (str): Directory to remove
+
+    """
+
+    try:
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
@@ -15,6 +15,7 @@ import pyudev
 from . import UUID_ROOT, OUTDIR, DBDIR
 from . import paths
 from . import ripper
+from . import utils
 
 KEY = 'DEVNAME'
 CHANGE = 'DISK_MEDIA_CHANGE'
@@ -43,7 +44,8 @@ class UdevWatchdog(QtCore.QThread):
 
     """
 
-    HANDLE_DISC = QtCore.pyqtSignal(str)
+    # Args are dev of disc and the disc UUID (None if not found)
+    HANDLE_DISC = QtCore.pyqtSignal(str, object)
 
     def __init__(
         self,
@@ -77,6 +79,8 @@ class UdevWatchdog(QtCore.QThread):
                 a dictionary of data loaded from the
                 disc database, and extras specifies if
                 extras should be ripped.
+            extract_threads (int) : Maximum number of titles to extract
+                from a disc backup at the same time.
 
         """
 
@@ -92,6 +96,10 @@ class UdevWatchdog(QtCore.QThread):
         self.outdir = outdir
         self.everything = everything
         self.extras = extras
+        self.extract_threads = kwargs.get(
+            'extract_threads',
+            ripper.EXTRACT_THREADS,
+        )
         self.root = root
         self.filegen = filegen
         self.progress_dialog = progress_dialog
@@ -122,6 +130,10 @@ class UdevWatchdog(QtCore.QThread):
         self.outdir = kwargs.get('outdir', self.outdir)
         self.everything = kwargs.get('everything', self.everything)
         self.extras = kwargs.get('extras', self.extras)
+        self.extract_threads = kwargs.get(
+            'extract_threads',
+            self.extract_threads,
+        )
 
     def get_settings(self):
 
@@ -130,6 +142,7 @@ class UdevWatchdog(QtCore.QThread):
             'outdir': self.outdir,
             'everything': self.everything,
             'extras': self.extras,
+            'extract_threads': self.extract_threads,
         }
 
     def run(self):
@@ -188,7 +201,8 @@ class UdevWatchdog(QtCore.QThread):
 
             self.log.debug("%s - Finished mounting", dev)
             self._mounted[dev] = None
-            self.HANDLE_DISC.emit(dev)
+            # Look up UUID here so the GUI thread does not have to
+            self.HANDLE_DISC.emit(dev, utils.get_discid(dev, self.root))
 
     def _ejecting(self, dev):
 
@@ -204,8 +218,8 @@ class UdevWatchdog(QtCore.QThread):
     def quit(self, *args, **kwargs):
         RUNNING.set()
 
-    @QtCore.pyqtSlot(str)
-    def handle_disc(self, dev: str):
+    @QtCore.pyqtSlot(str, object)
+    def handle_disc(self, dev: str, discid: str | None):
 
         self._mounted[dev] = ripper.DiscHandler(
             dev,
@@ -216,4 +230,6 @@ class UdevWatchdog(QtCore.QThread):
             self.root,
             self.filegen,
             self.progress_dialog,
+            discid=discid,
+            extract_threads=self.extract_threads,
         )
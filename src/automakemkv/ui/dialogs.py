@@ -22,15 +22,11 @@ class MissingOutdirDialog(QtWidgets.QDialog):
         self.buttonBox.rejected.connect(self.reject)
 
         self.layout = QtWidgets.QVBoxLayout()
-        message = (
-            "Could not find the requested output directory: ",
-            os.linesep,
-            outdir,
-            os.linesep,
-            "Would you like to select a new one?",
-        )
+        sep = os.linesep * 2
         message = QtWidgets.QLabel(
-            os.linesep.join(message)
+            f"Could not find the requested output directory:{sep}"
+            f"{outdir}{sep}"
+            "Would you like to select a new one?"
         )
         self.layout.addWidget(message)
         self.layout.addWidget(self.buttonBox)
@@ -39,7 +35,7 @@ class MissingOutdirDialog(QtWidgets.QDialog):
 
 class SettingsWidget(QtWidgets.QDialog):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, settings: dict | None = None, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.dbdir = widgets.PathSelector('Database Location:')
@@ -55,7 +51,7 @@ class SettingsWidget(QtWidgets.QDialog):
         radio_widget = QtWidgets.QWidget()
         radio_widget.setLayout(radio_layout)
 
-        self.set_settings()
+        self.set_settings(settings)
 
         buttons = (
             QtWidgets.QDialogButtonBox.Save
@@ -72,9 +68,18 @@ class SettingsWidget(QtWidgets.QDialog):
         layout.addWidget(button_box)
         self.setLayout(layout)
 
-    def set_settings(self):
+    def set_settings(self, settings: dict | None = None):
+        """
+        Set widget values from settings
+
+        Keyword arguments:
+            settings (dict): Current settings; loaded from the settings
+                file if not given
+
+        """
 
-        settings = utils.load_settings()
+        if settings is None:
+            settings = utils.load_settings()
         self.features.setChecked(True)
         if 'dbdir' in settings:
             self.dbdir.setText(settings['dbdir'])
@@ -87,14 +92,12 @@ class SettingsWidget(QtWidgets.QDialog):
 
     def get_settings(self):
 
-        settings = {
+        return {
             'dbdir': self.dbdir.getText(),
             'outdir': self.outdir.getText(),
             'extras': self.extras.isChecked(),
             'everything': self.everything.isChecked(),
         }
-        utils.save_settings(settings)
-        return settings
 
 
 class MyQDialog(QtWidgets.QDialog):
@@ -33,6 +33,7 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
         self.__log = logging.getLogger(__name__)
         self._name = name
         self._settingsInfo = None
+        self._settings_widget = None  # Built on first open of settings
         self._app = app
         self._menu = QtWidgets.QMenu()
 
@@ -55,6 +56,15 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
         self.setContextMenu(self._menu)
         self.setVisible(True)
 
+        self._quit_msg = QtWidgets.QMessageBox()
+        self._quit_msg.setIcon(QtWidgets.QMessageBox.Warning)
+        self._quit_msg.setText("Are you sure you want to quit?")
+        self._quit_msg.setWindowTitle(f"{self._name} Quit")
+        self._quit_msg.setStandardButtons(
+            QtWidgets.QMessageBox.Yes
+            | QtWidgets.QMessageBox.No
+        )
+
         settings = utils.load_settings()
 
         self.progress = progress.ProgressDialog()
@@ -74,11 +84,22 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
     def settings_widget(self, *args, **kwargs):
 
         self.__log.debug('opening settings')
-        settings_widget = dialogs.SettingsWidget()
+        settings = self.ripper.get_settings()
+        settings_widget = self._settings_widget
+        if settings_widget is None:
+            settings_widget = dialogs.SettingsWidget(settings=settings)
+            self._settings_widget = settings_widget
+        else:
+            settings_widget.set_settings(settings)
+
         if settings_widget.exec_():
             self.ripper.set_settings(
                 **settings_widget.get_settings(),
             )
+            # Save full settings; the dialog only knows some of them
+            utils.save_settings(
+                self.ripper.get_settings(),
+            )
 
     def quit(self, *args, **kwargs):
         """Display quit confirm dialog"""
@@ -93,15 +114,7 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
             self.ripper.quit()
             self._app.quit()
 
-        msg = QtWidgets.QMessageBox()
-        msg.setIcon(QtWidgets.QMessageBox.Warning)
-        msg.setText("Are you sure you want to quit?")
-        msg.setWindowTitle(f"{self._name} Quit")
-        msg.setStandardButtons(
-            QtWidgets.QMessageBox.Yes
-            | QtWidgets.QMessageBox.No
-        )
-        res = msg.exec_()
+        res = self._quit_msg.exec_()
         if res == QtWidgets.QMessageBox.Yes:
             self.ripper.quit()
             self._app.quit()
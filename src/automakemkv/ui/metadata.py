@@ -11,6 +11,8 @@ from . import dialogs
 from . import progress
 
 SIZEKEY = 'Disk Size (Bytes)'
+# MakeMKV title information copied into the metadata of new titles
+SOURCEKEYS = ('Source Title Id', 'Source FileName', 'Segments Map')
 
 RIP = 3
 SAVE = 2
@@ -97,6 +99,8 @@ class DiscMetadataEditor(dialogs.MyQDialog):
         )
         self.loadDisc.SIGNAL.connect(self.msgs.append)
         self.loadDisc.finished.connect(self.buildTitleTree)
+        # Update process to read from in the progress widget once started
+        self.loadDisc.NEW_PROCESS.connect(self.progress.new_process)
 
         if load_existing:
             path = utils.file_from_discid(self.discid, dbdir=self.dbdir)
@@ -106,10 +110,6 @@ class DiscMetadataEditor(dialogs.MyQDialog):
             )
         else:
             self.loadDisc.start()
-            self.loadDisc.started.wait()
-            # Update process to read from in the progress widget
-            # self.progress.new_process(self.loadDisc.proc)
-            self.progress.NEW_PROCESS.emit(self.loadDisc.proc)
 
         self.show()
 
@@ -313,11 +313,9 @@ class DiscMetadataEditor(dialogs.MyQDialog):
                 title.info = infoTitles[titleID]
                 title.setCheckState(0, 2)
             else:
-                keys = ['Source Title Id', 'Source FileName', 'Segments Map']
                 title.info = self.titleMetadata.getInfo()
-                title.info.update(
-                    {key: titleInfo.get(key, '') for key in keys}
-                )
+                for key in SOURCEKEYS:
+                    title.info[key] = titleInfo.get(key, '')
 
             # Used to update old files to contain the Segments Map
             # if 'Segments Map' not in title.info:
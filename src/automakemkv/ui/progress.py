@@ -6,9 +6,11 @@ from subprocess import Popen
 from PyQt5 import QtWidgets
 from PyQt5 import QtCore
 
+from .. import makemkv
 from . import utils
 
 MEGABYTE = 10**6
+PROGRESS_INTERVAL = 0.1  # Minimum seconds between progress value updates
 
 
 class ProgressDialog(QtWidgets.QWidget):
@@ -38,13 +40,18 @@ class ProgressDialog(QtWidgets.QWidget):
         )
 
         self.widgets = {}
+        self._pending = []  # Widgets waiting to be added to layout
         self.layout = QtWidgets.QVBoxLayout()
         self.setLayout(self.layout)
 
-        self.MKV_ADD_DISC.connect(self.mkv_add_disc)
-        self.MKV_REMOVE_DISC.connect(self.mkv_remove_disc)
-        self.MKV_NEW_PROCESS.connect(self.mkv_new_process)
-        self.MKV_CUR_TRACK.connect(self.mkv_current_track)
+        # These signals are emitted from ripper threads; always queue them so
+        # the slots run in the GUI thread and emitters never call them
+        # directly, even if emitted from the GUI thread
+        queued = QtCore.Qt.QueuedConnection
+        self.MKV_ADD_DISC.connect(self.mkv_add_disc, queued)
+        self.MKV_REMOVE_DISC.connect(self.mkv_remove_disc, queued)
+        self.MKV_NEW_PROCESS.connect(self.mkv_new_process, queued)
+        self.MKV_CUR_TRACK.connect(self.mkv_current_track, queued)
 
     def __len__(self):
         return len(self.widgets)
@@ -54,9 +61,39 @@ class ProgressDialog(QtWidgets.QWidget):
         self.log.debug("%s - Disc added", dev)
         widget = ProgressWidget(dev, info, full_disc)
         widget.CANCEL.connect(self.cancel)
-
-        self.layout.addWidget(widget)
         self.widgets[dev] = widget
+
+        # Widget is registered right away so process/track signals find it,
+        # but adding to the layout waits until control returns to the event
+        # loop so discs that show up together are laid out in one pass
+        if len(self._pending) == 0:
+            QtCore.QTimer.singleShot(0, self.add_pending)
+        self._pending.append(widget)
+
+    def add_pending(self):
+        """
+        Add all pending disc widgets to the layout
+
+        Widgets for discs removed before they were added are skipped.
+
+        """
+
+        widgets = [
+            widget
+            for widget in self._pending
+            if self.widgets.get(widget.dev, None) is widget
+        ]
+        self._pending = []
+        if len(widgets) == 0:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                self.layout.addWidget(widget)
+            self.layout.activate()
+        finally:
+            self.setUpdatesEnabled(True)
         self.show()
         self.adjustSize()
 
@@ -64,8 +101,12 @@ class ProgressDialog(QtWidgets.QWidget):
     def mkv_remove_disc(self, dev: str):
         widget = self.widgets.pop(dev, None)
         if widget is not None:
-            self.layout.removeWidget(widget)
-            widget.deleteLater()
+            self.setUpdatesEnabled(False)
+            try:
+                self.layout.removeWidget(widget)
+                widget.deleteLater()
+            finally:
+                self.setUpdatesEnabled(True)
             self.log.debug("%s - Disc removed", dev)
 
         if len(self.widgets) == 0:
@@ -259,7 +300,14 @@ class ProgressWidget(QtWidgets.QFrame):
 
         info = self.info['titles'][title]
         print(info)
-        self.metadata.update(info)
+
+        # Metadata labels are removed and re-added to the layout; hold
+        # repaints until done so the change is drawn once
+        self.setUpdatesEnabled(False)
+        try:
+            self.metadata.update(info)
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Increment number of titles processed and append file size
         self.n_titles += 1
@@ -327,14 +375,26 @@ class ProgressParser(QtCore.QThread):
     PROGRESS_TITLE = QtCore.pyqtSignal(str, str)
     PROGRESS_VALUE = QtCore.pyqtSignal(int, int, int)
 
-    def __init__(self, proc: Popen | None = None, pipe: str = 'stderr'):
+    def __init__(
+        self,
+        proc: Popen | None = None,
+        pipe: str = 'stderr',
+        interval: float = PROGRESS_INTERVAL,
+    ):
         super().__init__()
         self.log = logging.getLogger(__name__)
         self.proc = proc
         self.pipe = pipe
+        self.interval = interval
 
     def run(self):
 
+        # MakeMKV reports progress far more often than the GUI can repaint,
+        # so only pass on a value once every interval. The newest value
+        # held back is sent before the next label and at EOF so the final
+        # value of each phase is never lost
+        last_value = 0.0
+        dropped = None
         while self.proc is None or self.proc.poll() is None:
             if self.proc is None:
                 time.sleep(0.5)
@@ -342,25 +402,48 @@ class ProgressParser(QtCore.QThread):
 
             pipe = getattr(self.proc, self.pipe, None)
             if pipe is None:
+                time.sleep(0.5)
                 continue
 
+            # readline() blocks until data is available. An empty line
+            # (EOF) or closed pipe means the process is exiting, so wait
+            # for that instead of spinning on the pipe
             try:
                 line = pipe.readline()
             except Exception:
+                line = b''
+            if line == b'':
+                if dropped is not None:
+                    self.PROGRESS_VALUE.emit(*dropped)
+                    dropped = None
+                self.proc.wait()
                 continue
 
-            mtype, *vals = line.split(':')
-            vals = ":".join(vals).split(',')
-
-            if mtype == 'PRGV':
-                self.PROGRESS_VALUE.emit(*map(int, vals))
+            # Lines are raw bytes; PRGV values are parsed without decoding
+            # and only lines that are emitted as text get decoded
+            mtype, _, vals = line.partition(b':')
+            if mtype == b'PRGV':
+                values = tuple(map(int, vals.split(b',')))
+                now = time.monotonic()
+                if now - last_value < self.interval:
+                    dropped = values
+                    continue
+                last_value = now
+                dropped = None
+                self.PROGRESS_VALUE.emit(*values)
                 continue
 
+            if dropped is not None:
+                self.PROGRESS_VALUE.emit(*dropped)
+                dropped = None
+
             self.PROGRESS_TITLE.emit(
-                mtype,
-                vals[-1].rstrip().strip('"'),
+                makemkv.decode(mtype),
+                makemkv.decode(vals.split(b',')[-1]).rstrip().strip('"'),
             )
 
+        if dropped is not None:
+            self.PROGRESS_VALUE.emit(*dropped)
         self.PROGRESS_VALUE.emit(-1, -1, -1)
         self.log.debug("Progress processor thread dead")
 
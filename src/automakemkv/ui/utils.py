@@ -4,6 +4,8 @@ import re
 import json
 import gzip
 
+from functools import lru_cache
+
 from .. import OUTDIR, DBDIR, SETTINGS_FILE
 
 EXT = '.json'
@@ -12,17 +14,28 @@ TRACKSIZE_REG = re.compile(
     rf"TINFO:(\d+),{TRACKSIZE_AP},\d+,\"(\d+)\"",
 )
 
+# Track sizes parsed from MakeMKV info files; see load_sizes()
+_SIZES_CACHE = {}
+# Last settings read/written and stat key of file; see load_settings()
+_SETTINGS_CACHE = {'key': None, 'data': None}
+
 
 def load_settings() -> dict:
     """
     Load dict from data JSON file
 
+    Settings are loaded each time a settings dialog or tray is created, so
+    the parsed data are cached and the file is only re-read if it has
+    changed on disk.
+
     Returns:
         dict: Settings data loaded from JSON file
 
     """
 
-    if not os.path.isfile(SETTINGS_FILE):
+    try:
+        key = _stat_key(SETTINGS_FILE)
+    except FileNotFoundError:
         settings = {
             'dbdir': DBDIR,
             'outdir': OUTDIR,
@@ -33,27 +46,73 @@ def load_settings() -> dict:
         save_settings(settings)
         return settings
 
+    if _SETTINGS_CACHE['key'] == key:
+        return dict(_SETTINGS_CACHE['data'])
+
     logging.getLogger(__name__).debug(
         'Loading settings from %s', SETTINGS_FILE,
     )
     with open(SETTINGS_FILE, 'r') as fid:
-        return json.load(fid)
+        settings = json.load(fid)
+
+    _SETTINGS_CACHE.update(key=key, data=settings)
+    return dict(settings)
 
 
 def save_settings(settings: dict) -> None:
     """
     Save dict to JSON file
 
+    Nothing is written if the settings match those last read or written
+    and the file is unchanged on disk. Data are written to a temporary
+    file that then replaces the settings file so a partial write can never
+    leave a corrupt settings file.
+
     Arguments:
         settings (dict): Settings to save to JSON file
 
     """
 
-    logging.getLogger(__name__).debug(
-        'Saving settings to %s', SETTINGS_FILE,
-    )
-    with open(SETTINGS_FILE, 'w') as fid:
+    log = logging.getLogger(__name__)
+    try:
+        key = _stat_key(SETTINGS_FILE)
+    except FileNotFoundError:
+        key = None
+
+    if (
+        key is not None
+        and key == _SETTINGS_CACHE['key']
+        and settings == _SETTINGS_CACHE['data']
+    ):
+        log.debug('Settings unchanged, not saving')
+        return
+
+    log.debug('Saving settings to %s', SETTINGS_FILE)
+    tmpfile = f"{SETTINGS_FILE}.tmp"
+    with open(tmpfile, 'w') as fid:
         json.dump(settings, fid)
+    os.replace(tmpfile, SETTINGS_FILE)
+
+    _SETTINGS_CACHE.update(
+        key=_stat_key(SETTINGS_FILE),
+        data=dict(settings),
+    )
+
+
+def _stat_key(path: str) -> tuple[int]:
+    """
+    Get key to check if file changed
+
+    Arguments:
+        path (str): File to stat
+
+    Returns:
+        tuple[int]: Modification time (ns) and size of file
+
+    """
+
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
 
 
 def load_metadata(
@@ -80,6 +139,29 @@ def load_metadata(
         info = json.load(fid)
 
     infopath = os.path.splitext(fpath)[0]+'.info.gz'
+    return info, load_sizes(infopath)
+
+
+def load_sizes(infopath: str) -> dict:
+    """
+    Load track sizes from MakeMKV info file
+
+    Decompressing and searching the info file is the slow part of loading
+    metadata, so results are cached until the file is modified.
+
+    Arguments:
+        infopath (str): Path to gzipped MakeMKV robot output
+
+    Returns:
+        dict: Size in bytes of each title, keyed by title number
+
+    """
+
+    mtime = os.stat(infopath).st_mtime_ns
+    cached = _SIZES_CACHE.get(infopath, None)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+
     with gzip.open(infopath, 'rt') as fid:
         data = fid.read()
 
@@ -87,7 +169,8 @@ def load_metadata(
         matchobj.group(1): int(matchobj.group(2))
         for matchobj in TRACKSIZE_REG.finditer(data)
     }
-    return info, sizes
+    _SIZES_CACHE[infopath] = (mtime, sizes)
+    return dict(sizes)
 
 
 def save_metadata(
@@ -131,10 +214,14 @@ def file_from_discid(discid: str, dbdir: str | None = None):
     )
 
 
+@lru_cache(maxsize=32)
 def get_vendor_model(path: str) -> tuple[str]:
     """
     Get the vendor and model of drive
 
+    Called each time a disc is inserted, so results are cached per device
+    as the drive behind a dev device rarely changes.
+
     """
 
     path = os.path.join(
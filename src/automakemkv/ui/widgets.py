@@ -16,15 +16,13 @@ class PathSelector(QtWidgets.QWidget):
         self.path_button = QtWidgets.QPushButton('Select Path')
         self.path_button.clicked.connect(self.path_select)
 
-        layout = QtWidgets.QHBoxLayout()
-        layout.addWidget(self.path_text)
-        layout.addWidget(self.path_button)
-        widget = QtWidgets.QWidget()
-        widget.setLayout(layout)
+        path_layout = QtWidgets.QHBoxLayout()
+        path_layout.addWidget(self.path_text)
+        path_layout.addWidget(self.path_button)
 
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(QtWidgets.QLabel(label))
-        layout.addWidget(widget)
+        layout.addLayout(path_layout)
 
         self.setLayout(layout)
 
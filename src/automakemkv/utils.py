@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 from . import UUID_ROOT
 
@@ -20,11 +21,54 @@ def get_discid(discDev: str, root: str = UUID_ROOT, **kwargs) -> str | None:
 
     """
 
-    for item in os.listdir(root):
-        path = os.path.join(root, item)
-        src = os.readlink(path)
-        src = os.path.abspath(os.path.join(root, src))
-        if src == discDev:
-            return item
+    with os.scandir(root) as it:
+        for entry in it:
+            src = os.readlink(entry.path)
+            src = os.path.abspath(os.path.join(root, src))
+            if src == discDev:
+                return entry.name
 
     return None
+
+
+def is_rotational(path: str) -> bool | None:
+    """
+    Check if path is on rotational (spinning) storage
+
+    Arguments:
+        path (str): Path to check; must exist
+
+    Returns:
+        bool | None: True if on rotational storage, False if not, None if
+            could not be determined (e.g., not on Linux)
+
+    """
+
+    try:
+        st_dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    return _dev_is_rotational(st_dev)
+
+
+@lru_cache(maxsize=None)
+def _dev_is_rotational(st_dev: int) -> bool | None:
+    """
+    Check sysfs for if block device is rotational
+
+    Results are cached per device so the probe only happens once.
+
+    """
+
+    root = os.path.join(
+        '/sys/dev/block',
+        f"{os.major(st_dev)}:{os.minor(st_dev)}",
+    )
+    # Partitions do not have a queue directory, so check parent device too
+    for path in (root, os.path.join(root, '..')):
+        try:
+            with open(os.path.join(path, 'queue', 'rotational')) as iid:
+                return iid.read().strip() == '1'
+        except OSError:
+            continue
+    return None